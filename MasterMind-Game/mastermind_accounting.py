@@ -0,0 +1,124 @@
+import collections
+import datetime
+import tracemalloc
+
+
+def count_board_items(screen):
+    """
+    Counts what the board holds on to: live turtles, canvas items and
+    stamps of all turtles.
+    :param screen: The turtle screen of the game.
+    :return: Dictionary with the turtles, canvas_items and stamps counts.
+    """
+    turtles = screen.turtles()
+    return {
+        "turtles": len(turtles),
+        "canvas_items": len(screen.getcanvas().find_all()),
+        "stamps": sum(len(t.stampItems) for t in turtles),
+    }
+
+
+def grows_without_bound(values, tolerance=0):
+    """
+    Checks a series of per game values for steady growth: the largest value
+    in the second half must not exceed the largest value in the first half
+    by more than the tolerance. Bounded values level off after the first
+    games, growing ones keep setting new highs.
+    :param values: List of values, one per game.
+    :param tolerance: Allowed increase of the largest value.
+    :return: bool: True if the values keep growing. False otherwise.
+    """
+    half = len(values) // 2
+    if half == 0:
+        return False
+    return max(values[half:]) > max(values[:half]) + tolerance
+
+
+class BoardAccounting:
+    """
+    This class keeps track of the turtles, canvas items and stamps on the
+    board, and of the memory used when tracing is on. A sample is taken on
+    every refresh of the board and at the end of every game, and a
+    tracemalloc snapshot is kept for the first and latest game, so growth
+    over a long session can be seen while playing or dumped on quit.
+    """
+    def __init__(self, screen, trace_memory=False, max_samples=10000):
+        """
+        Creates the accounting for a screen.
+        :param screen: The turtle screen of the game.
+        :param trace_memory: Boolean flag to trace memory with tracemalloc.
+        The default is False, since tracing slows the game down.
+        :param max_samples: Number of refresh samples kept.
+        """
+        self.screen = screen
+        self.trace_memory = trace_memory
+        self.refreshes = collections.deque(maxlen=max_samples)
+        self.games = []
+        self.first_snapshot = None
+        self.last_snapshot = None
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def sample(self, game_number):
+        """
+        Takes a sample of the board items and memory.
+        :param game_number: Number of the game being played.
+        :return: Dictionary with the counts of the sample.
+        """
+        sample = {"game": game_number}
+        sample.update(count_board_items(self.screen))
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            sample["memory"] = current
+            sample["memory_peak"] = peak
+        return sample
+
+    def record_refresh(self, game_number):
+        """
+        Records a sample after a refresh of the board.
+        :param game_number: Number of the game being played.
+        """
+        self.refreshes.append(self.sample(game_number))
+
+    def record_game(self, game_number):
+        """
+        Records a sample and a memory snapshot at the end of a game.
+        :param game_number: Number of the game that ended.
+        """
+        self.games.append(self.sample(game_number))
+        if self.trace_memory:
+            self.last_snapshot = tracemalloc.take_snapshot()
+            if self.first_snapshot is None:
+                self.first_snapshot = self.last_snapshot
+
+    def latest(self):
+        """
+        Returns the latest refresh sample.
+        :return: Dictionary with the counts, or None before any refresh.
+        """
+        return self.refreshes[-1] if self.refreshes else None
+
+    def report(self, top=10):
+        """
+        Describes the current counts, the counts at the end of each game
+        and the biggest memory growth since the first game.
+        :param top: Number of memory growth lines to include.
+        :return: The report as a string.
+        """
+        lines = [f"Now: {self.sample(len(self.games))}"]
+        for sample in self.games:
+            lines.append(f"Game {sample['game']}: {sample}")
+        if self.first_snapshot is not None:
+            lines.append("Memory growth since the first game:")
+            growth = self.last_snapshot.compare_to(self.first_snapshot, "lineno")
+            lines.extend(str(stat) for stat in growth[:top])
+        return "\n".join(lines)
+
+    def dump(self, filename):
+        """
+        Appends the report to a file with a timestamp.
+        :param filename: Name of the file to write.
+        """
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with open(filename, "a") as file:
+            file.write(f"{timestamp} - Board accounting\n{self.report()}\n")
@@ -0,0 +1,204 @@
+import functools
+import itertools
+
+
+# Feedback masks are kept for this many guesses per code space.
+MAX_CACHED_GUESSES = 64
+
+
+class CodeSpace:
+    """
+    This class numbers every possible secret code of a configuration (codes
+    of distinct colors, in the order of itertools.permutations) and stores
+    sets of codes as bitsets: a Python integer where bit i is set when code
+    i is in the set. For every guess it precomputes one mask per feedback
+    (bulls, cows), so the codes still consistent with a guess are found by
+    intersecting bitsets instead of scoring every code again.
+
+    Feedback is itself computed on bitsets: one bitset per (position, color)
+    and per color, summed with bit-sliced counters, so a set of codes is
+    split by feedback with a few integer operations per peg.
+    """
+    def __init__(self, colors, guess_spots):
+        """
+        Creates the code space for a palette and number of pegs.
+        :param colors: The palette of colors.
+        :param guess_spots: Number of pegs in a code.
+        """
+        self.colors = list(colors)
+        self.guess_spots = guess_spots
+        self.codes = list(itertools.permutations(self.colors, guess_spots))
+        self.index = {code: i for i, code in enumerate(self.codes)}
+        self.all_codes = (1 << len(self.codes)) - 1
+        self.num_bytes = (len(self.codes) + 7) // 8
+
+        # Set of colors of each code as a bitset, to count common colors.
+        color_bits = {color: 1 << i for i, color in enumerate(self.colors)}
+        self.code_colors = [
+            sum(color_bits[color] for color in code) for code in self.codes
+        ]
+
+        # Codes with a color at a position, and codes containing a color.
+        position_bytes = [
+            {color: bytearray(self.num_bytes) for color in self.colors}
+            for _ in range(guess_spots)
+        ]
+        for i, code in enumerate(self.codes):
+            for position, color in enumerate(code):
+                position_bytes[position][color][i >> 3] |= 1 << (i & 7)
+        self.position_masks = [
+            {color: int.from_bytes(data, "little") for color, data in masks.items()}
+            for masks in position_bytes
+        ]
+        self.color_masks = {
+            color: sum(masks[color] for masks in self.position_masks)
+            for color in self.colors
+        }
+        self._masks = {}
+
+    def feedback(self, guess_index, code_index):
+        """
+        Scores a code against a guess, both given by their index.
+        :param guess_index: Index of the guess.
+        :param code_index: Index of the code taken as the secret.
+        :return: Tuple containing number of bulls and cows.
+        """
+        guess = self.codes[guess_index]
+        code = self.codes[code_index]
+        bulls = sum(1 for a, b in zip(guess, code) if a == b)
+        common = self.code_colors[guess_index] & self.code_colors[code_index]
+        return bulls, common.bit_count() - bulls
+
+    def feedback_masks(self, guess):
+        """
+        Returns the masks of codes for every feedback of a guess. The masks
+        are computed once per guess and cached.
+        :param guess: List or tuple of colors for the guess.
+        :return: Dictionary of (bulls, cows) to the bitset of codes that
+        give that feedback.
+        """
+        guess = tuple(guess)
+        masks = self._masks.get(guess)
+        if masks is not None:
+            return masks
+
+        masks = self.partition(guess, self.all_codes)
+        if len(self._masks) >= MAX_CACHED_GUESSES:
+            self._masks.clear()
+        self._masks[guess] = masks
+        return masks
+
+    def partition(self, guess, candidates):
+        """
+        Splits a set of codes by the feedback each would give to a guess.
+        Works on the remaining codes only, all of them at once: the bulls
+        and the common colors of every code are counted in bit-sliced
+        counters, one bitset per counter bit.
+        :param guess: List or tuple of distinct colors for the guess.
+        :param candidates: Bitset of the codes to split.
+        :return: Dictionary of (bulls, cows) to the non-empty bitset of
+        codes that give that feedback.
+        """
+        bulls_count = _bit_sliced_sum(
+            self.position_masks[position][color] & candidates
+            for position, color in enumerate(guess)
+        )
+        common_count = _bit_sliced_sum(
+            self.color_masks[color] & candidates for color in guess
+        )
+
+        groups = {}
+        for bulls in range(len(guess) + 1):
+            bulls_mask = _count_equals(bulls_count, bulls, candidates)
+            if not bulls_mask:
+                continue
+            for common in range(bulls, len(guess) + 1):
+                mask = _count_equals(common_count, common, bulls_mask)
+                if mask:
+                    groups[(bulls, common - bulls)] = mask
+        return groups
+
+    def filter(self, candidates, guess, bulls, cows):
+        """
+        Keeps the candidates that would have given this feedback.
+        :param candidates: Bitset of the remaining codes.
+        :param guess: List or tuple of colors for the guess.
+        :param bulls: Number of bulls for the guess.
+        :param cows: Number of cows for the guess.
+        :return: Bitset of the codes still consistent.
+        """
+        return candidates & self.feedback_masks(guess).get((bulls, cows), 0)
+
+    def indices(self, candidates):
+        """
+        Yields the index of every code in a bitset, in increasing order.
+        :param candidates: Bitset of codes.
+        """
+        data = candidates.to_bytes(self.num_bytes, "little")
+        for byte_index, byte in enumerate(data):
+            base = byte_index << 3
+            while byte:
+                low = byte & -byte
+                yield base + low.bit_length() - 1
+                byte ^= low
+
+    def decode(self, candidates, limit=None):
+        """
+        Lists the codes of a bitset.
+        :param candidates: Bitset of codes.
+        :param limit: Maximum number of codes to list. All when None.
+        :return: List of codes, each a list of colors.
+        """
+        codes = itertools.islice(self.indices(candidates), limit)
+        return [list(self.codes[i]) for i in codes]
+
+
+def _bit_sliced_sum(bitsets):
+    """
+    Adds bitsets lane by lane: for every code, counts how many of the
+    bitsets contain it.
+    :param bitsets: Iterable of bitsets.
+    :return: List of bitsets where bit i of entry j is bit j of the count
+    of code i.
+    """
+    planes = []
+    for carry in bitsets:
+        for j in range(len(planes)):
+            planes[j], carry = planes[j] ^ carry, planes[j] & carry
+            if not carry:
+                break
+        if carry:
+            planes.append(carry)
+    return planes
+
+
+def _count_equals(planes, value, codes):
+    """
+    Selects the codes whose bit-sliced count equals a value.
+    :param planes: Bit-sliced counts from _bit_sliced_sum().
+    :param value: The count to select.
+    :param codes: Bitset of the codes to select from.
+    :return: Bitset of the selected codes.
+    """
+    if value >> len(planes):
+        return 0
+    for j, plane in enumerate(planes):
+        codes &= plane if value >> j & 1 else ~plane
+    return codes
+
+
+@functools.lru_cache(maxsize=8)
+def _code_space(colors, guess_spots):
+    """Creates the code space for a hashable configuration."""
+    return CodeSpace(colors, guess_spots)
+
+
+def get_code_space(colors, guess_spots):
+    """
+    Returns the shared code space of a configuration, so that games with the
+    same colors and pegs reuse the same codes and cached masks.
+    :param colors: The palette of colors.
+    :param guess_spots: Number of pegs in a code.
+    :return: A CodeSpace instance.
+    """
+    return _code_space(tuple(colors), guess_spots)
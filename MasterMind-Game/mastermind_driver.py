@@ -0,0 +1,226 @@
+import argparse
+import math
+import os
+import random
+import tempfile
+import time
+
+from mastermind_game import MastermindGame
+
+
+def percentile(values, percent):
+    """
+    Returns the nearest-rank percentile of a list of values.
+    :param values: List of numbers.
+    :param percent: The percentile, from 0 to 100.
+    :return: The value at that percentile, or 0 for an empty list.
+    """
+    if not values:
+        return 0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(values):
+    """
+    Summarizes a latency distribution.
+    :param values: List of latencies in seconds.
+    :return: Dictionary with the count, and the mean, p50, p90, p99 and max
+    in milliseconds.
+    """
+    summary = {"count": len(values)}
+    summary["mean"] = 1000 * sum(values) / len(values) if values else 0
+    for percent in [50, 90, 99]:
+        summary[f"p{percent}"] = 1000 * percentile(values, percent)
+    summary["max"] = 1000 * max(values, default=0)
+    return summary
+
+
+def start_scripted_session(player_name, directory, **options):
+    """
+    Creates a game and starts a scripted session with the leaderboard, the
+    error log and the board accounting written to a directory, so a session
+    never touches the real files.
+    :param player_name: The name of the player for the session.
+    :param directory: Directory for the files of the session.
+    :param options: Other keyword arguments for MastermindGame.
+    :return: The started MastermindGame.
+    """
+    game = MastermindGame(
+        test_mode=True,
+        accounting_file=os.path.join(directory, "mastermind_accounting.log"),
+        **options
+    )
+    game.leaderboard_file = os.path.join(directory, "leaderboard.txt")
+    game.error_log_file = os.path.join(directory, "mastermind_errors.err")
+    game.start_session(player_name)
+    return game
+
+
+class ClickDriver:
+    """
+    This class plays complete games by feeding synthetic clicks into
+    on_screen_click, at coordinates taken from button_locations and
+    button_locate, the same way a player would. For every event it measures
+    the end-to-end latency, including the canvas update, and the redraw
+    cost: how many board refreshes the event caused and how long they took.
+    """
+    def __init__(self, game, events_per_second=None, reset_rate=0.1, seed=None):
+        """
+        Creates a driver for a game started with start_session().
+        :param game: The MastermindGame to drive.
+        :param events_per_second: Rate of the clicks. As fast as possible
+        when None.
+        :param reset_rate: Chance of clicking reset instead of check once a
+        guess is complete, from 0 up to but not including 1, since games
+        never end if every guess is reset.
+        :param seed: Seed for the random color picks.
+        """
+        if not 0 <= reset_rate < 1:
+            raise ValueError(f"reset_rate must be in [0, 1), got {reset_rate}")
+        self.game = game
+        self.interval = 1 / events_per_second if events_per_second else 0
+        self.reset_rate = reset_rate
+        self.random = random.Random(seed)
+        self.events = []
+        self.game_latencies = []
+        self.next_event = time.perf_counter()
+
+        # Time every board refresh of the game.
+        self.refresh_count = 0
+        self.refresh_time = 0.0
+        update_game_board = game.update_game_board
+
+        def timed_update_game_board():
+            start = time.perf_counter()
+            update_game_board()
+            self.refresh_count += 1
+            self.refresh_time += time.perf_counter() - start
+
+        game.update_game_board = timed_update_game_board
+
+    def click_target(self, name):
+        """
+        Finds where to click for a color or an action button.
+        :param name: A color, or "check", "reset" or "quit".
+        :return: Tuple of the x and y position of the click.
+        """
+        if name in self.game.button_locate:
+            button = self.game.button_locate[name]
+            x = sum(button["x_range"]) / 2
+            y = sum(button["y_range"]) / 2
+            return x, y
+        return self.game.button_locations[name]
+
+    def click(self, kind, name):
+        """
+        Sends one click, waiting for its turn at the configured rate, and
+        records its latency and redraw cost.
+        :param kind: The kind of event: "color", "check" or "reset".
+        :param name: The color or button to click.
+        """
+        delay = self.next_event - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        self.next_event = time.perf_counter() + self.interval
+
+        x, y = self.click_target(name)
+        refresh_count = self.refresh_count
+        refresh_time = self.refresh_time
+        start = time.perf_counter()
+        self.game.on_screen_click(x, y)
+        self.game.screen.getcanvas().update()
+        latency = time.perf_counter() - start
+
+        self.events.append({
+            "kind": kind,
+            "game": self.game.games_played,
+            "latency": latency,
+            "refreshes": self.refresh_count - refresh_count,
+            "refresh_time": self.refresh_time - refresh_time,
+            "canvas_items": len(self.game.screen.getcanvas().find_all()),
+        })
+
+    def play_game(self):
+        """
+        Plays one game to its end (a win or running out of guesses) with
+        random color picks, and occasional resets of the current guess.
+        """
+        game_number = self.game.games_played
+        first_event = len(self.events)
+        while self.game.games_played == game_number:
+            while len(self.game.current_guess) < self.game.guess_spots:
+                choices = [
+                    color for color in self.game.colors
+                    if color not in self.game.current_guess
+                ]
+                self.click("color", self.random.choice(choices))
+
+            if self.random.random() < self.reset_rate:
+                self.click("reset", "reset")
+            else:
+                self.click("check", "check")
+
+        latencies = [event["latency"] for event in self.events[first_event:]]
+        self.game_latencies.append(sum(latencies) / len(latencies))
+
+    def play(self, num_games):
+        """
+        Plays a number of complete games.
+        :param num_games: Number of games to play.
+        """
+        for _ in range(num_games):
+            self.play_game()
+
+    def report(self):
+        """
+        Summarizes the latency of each kind of event and the redraw cost.
+        :return: Dictionary of event kind to its latency summary, plus
+        "all" for every event, each with the mean refreshes and refresh
+        time per event.
+        """
+        report = {}
+        kinds = sorted({event["kind"] for event in self.events})
+        for kind in kinds + ["all"]:
+            events = [
+                event for event in self.events
+                if kind == "all" or event["kind"] == kind
+            ]
+            summary = summarize([event["latency"] for event in events])
+            refreshes = sum(event["refreshes"] for event in events)
+            refresh_time = sum(event["refresh_time"] for event in events)
+            summary["refreshes"] = refreshes / len(events)
+            summary["refresh_ms"] = 1000 * refresh_time / len(events)
+            report[kind] = summary
+        return report
+
+
+def main():
+    """
+    Plays scripted games in one session and prints the latency report and
+    the mean latency of each game, to see if it grows over the session.
+    """
+    parser = argparse.ArgumentParser(description="Mastermind click driver")
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--rate", type=float, default=None,
+                        help="clicks per second (default: as fast as possible)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    # Session files go to a temporary directory, not the real leaderboard.
+    with tempfile.TemporaryDirectory() as directory:
+        game = start_scripted_session("Driver", directory)
+
+        driver = ClickDriver(game, args.rate, seed=args.seed)
+        driver.play(args.games)
+        for kind, summary in driver.report().items():
+            values = [f"{key}={value:.2f}" for key, value in summary.items()]
+            print(f"{kind}: {', '.join(values)}")
+        for number, latency in enumerate(driver.game_latencies):
+            print(f"Game {number + 1}: mean latency {1000 * latency:.2f} ms")
+        game.quit_game()
+
+
+if __name__ == "__main__":
+    main()
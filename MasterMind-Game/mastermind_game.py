@@ -2,6 +2,11 @@ import turtle
 import random
 import datetime
 import os
+import argparse
+
+from mastermind_accounting import BoardAccounting
+from mastermind_candidates import get_code_space
+from mastermind_hints import HintWorker
 
 
 class MastermindGame:
@@ -16,7 +21,15 @@ class MastermindGame:
     draws game elements and maintains leaderboard by creating leaderboard.txt
     to track scores.
     """
-    def __init__(self, test_mode=False):
+    # Default game configuration, readable without creating a game.
+    COLORS = ["red", "blue", "green", "yellow", "purple", "black"]
+    GUESS_SPOTS = 4
+    NUM_GUESSES = 10
+
+    def __init__(self, test_mode=False, evil_mode=False,
+                 show_possible_codes=False, trace_memory=False,
+                 accounting_file="mastermind_accounting.log",
+                 secret_code=None):
         """
         Creates a new instance for the game. Sets up the game configuration,
         including colors, radius for pegs, number of guesses, secret code, vs.
@@ -24,27 +37,63 @@ class MastermindGame:
         starts without graphics.
         :param test_mode: Boolean flag indicates whether the game is being
         initialized in test mode or not. The default is False.
+        :param evil_mode: Boolean flag for the adversarial opponent, which
+        does not fix the secret code and answers every guess with the
+        feedback that keeps the most codes possible. The default is False.
+        :param show_possible_codes: Boolean flag to list the first codes
+        still possible on the board. The default is False.
+        :param trace_memory: Boolean flag to trace memory in the board
+        accounting. The default is False, since tracing slows the game down.
+        :param accounting_file: Name of the file the board accounting is
+        dumped to on quit.
+        :param secret_code: List of colors for the secret code. A code is
+        drawn from the global random generator when None.
         """
         # Game Configuration
-        self.colors = ["red", "blue", "green", "yellow", "purple", "black"]
+        self.colors = list(self.COLORS)
         self.radius = 15
-        self.num_guesses = 10
-        self.guess_spots = 4
-        self.secret_code = random.sample(self.colors, 4)
+        self.num_guesses = self.NUM_GUESSES
+        # Rows of the guess history shown at once, and the first shown.
+        self.visible_rows = 10
+        self.scroll_offset = 0
+        self.guess_spots = self.GUESS_SPOTS
+        self.evil_mode = evil_mode
+        if secret_code is None:
+            secret_code = self.new_secret_code()
+        self.secret_code = list(secret_code)
         self.guess_history = []
         self.current_guess = []
+        # Bitset of codes consistent with guess_history, None for all codes.
+        self.candidates = None
+        self.show_possible_codes = show_possible_codes
+        self.possible_codes_shown = 6
+        self.hint_worker = None
+        self.hint_text = ""
+        # Number of the latest hint request, only its poll keeps running.
+        self.hint_request = 0
         self.button_locations = {}
         self.leaderboard_file = "leaderboard.txt"
         self.error_log_file = "mastermind_errors.err"
+        # Prompts are skipped when False, for scripted sessions.
+        self.interactive = True
+        # Board item and memory accounting, dumped on quit.
+        self.accounting = None
+        self.trace_memory = trace_memory
+        self.accounting_file = accounting_file
+        self.games_played = 0
+        self.button_turtles = None
+        self.message_turtle = None
         if not test_mode:
             self.game_graphics()
 
-    def game_graphics(self):
+    def game_graphics(self, start=True):
         """
         Sets up the graphical UI for the Mastermind game.Includes
         screen configuration, drawing and texting turtles, adding shapes for
         gif buttons, and initializing UI elements such as arrow indicator,
         pop-ups and event bindings.
+        :param start: Boolean flag to start the game and its main loop.
+        The default is True.
         """
         # Screen Configuration
         self.screen = turtle.Screen()
@@ -76,17 +125,44 @@ class MastermindGame:
         self.button_locate = {
             "check": {"x_range": (40, 80), "y_range": (-230, -190)},
             "reset": {"x_range": (80, 120), "y_range": (-230, -190)},
-            "quit": {"x_range": (135, 205), "y_range": (-230, -190)}
+            "quit": {"x_range": (135, 205), "y_range": (-230, -190)},
+            "hint": {"x_range": (150, 220), "y_range": (-172, -145)},
+            "scroll_up": {"x_range": (10, 38), "y_range": (255, 278)},
+            "scroll_down": {"x_range": (10, 38), "y_range": (-138, -115)}
         }
 
+        # Turtle and background worker for hints
+        self.hint_drawer = turtle.Turtle()
+        self.hint_drawer.hideturtle()
+        self.hint_drawer.penup()
+        self.hint_worker = HintWorker(self.log_error)
+
         self.initialize_arrow_indicator()
         self.popup_turtle = None
 
         # Binding Click Clicking
         self.screen.onclick(self.on_screen_click, 1)
 
+        # Binding arrow keys and mouse wheel for scrolling the history
+        self.screen.onkey(lambda: self.scroll_history(-1), "Up")
+        self.screen.onkey(lambda: self.scroll_history(1), "Down")
+        self.screen.listen()
+        canvas = self.screen.getcanvas()
+        canvas.bind("<MouseWheel>", lambda event: self.scroll_history(
+            -1 if event.delta > 0 else 1))
+        canvas.bind("<Button-4>", lambda event: self.scroll_history(-1))
+        canvas.bind("<Button-5>", lambda event: self.scroll_history(1))
+
+        # Accounting of board items, printed with F2
+        self.accounting = BoardAccounting(self.screen, self.trace_memory)
+        self.screen.onkey(lambda: print(self.accounting.report()), "F2")
+
+        # Closing the window quits the game the same way as the Quit button
+        canvas.winfo_toplevel().protocol("WM_DELETE_WINDOW", self.quit_game)
+
         # Start The Game
-        self.start_game()
+        if start:
+            self.start_game()
 
     # ***** ~ Drawing Methods ~ *****
     def circle(self, x, y, radius, color):
@@ -132,7 +208,10 @@ class MastermindGame:
         self.drawer.pensize(1)
 
     def guessing_frame(self):
-        """Draws the guessing frame of the game"""
+        """
+        Draws the guessing frame of the game. Only the rows that fit in the
+        frame are drawn, with a marker when rows are hidden above or below.
+        """
         start_x = -180
         start_y = 250
         # draw the outer rectangle of the guesing frame
@@ -140,8 +219,18 @@ class MastermindGame:
         self.drawer.goto(-150, 250)
         self.drawer.color("black")
 
+        # Scroll markers for the hidden rows.
+        rows = self.visible_row_range()
+        font_settings = ("Arial", 14, "normal")
+        if rows.start > 0:
+            self.drawer.goto(24, 257)
+            self.drawer.write("\u25b2", align="center", font=font_settings)
+        if rows.stop < self.num_guesses:
+            self.drawer.goto(24, -136)
+            self.drawer.write("\u25bc", align="center", font=font_settings)
+
         # Loop to create rows in the guessing frame
-        for i in range(10):
+        for i in range(len(rows)):
 
             # Nested loop to create individual guessing spots.
             for j in range(4):
@@ -177,8 +266,10 @@ class MastermindGame:
         wrong positions. (red)
         :param row: The row number on the grid where the pegs are to be drawn.
         """
+        if row not in self.visible_row_range():
+            return
         new_start_x = -180 + (self.guess_spots * 40)
-        start_y = 250 - (row * 40)
+        start_y = self.row_y(row)
 
         # loop for draw up to four scoring pegs
         for i in range(4):
@@ -225,42 +316,44 @@ class MastermindGame:
     def gif_buttons(self):
         """
         Creates and positions gif buttons (check, reset,  quit) on the game.
-        Initializes individual turtle instances for each button, and places
-        them at given spots. Also updates the button_locations attribute
+        Initializes individual turtle instances for each button once, and
+        stamps them again on each refresh since the redrawn board covers
+        the old stamps. Also updates the button_locations attribute
         for click detection.
         """
         # Starting positions for gif buttons.
         start_x = 60  # Position after the last color button
         start_y = -210 # y position of the gif buttons
 
-        # Check Button
-        check_button_turtle = turtle.Turtle()
-        check_button_turtle.shape("checkbutton.gif")
-        check_button_turtle.penup()
-        check_button_turtle.goto(start_x, start_y)
-        check_button_turtle.stamp()
-
-        # Reset Button
-        start_x += 40  # Position from the Check Button
-        reset_button_turtle = turtle.Turtle()
-        reset_button_turtle.shape("xbutton.gif")
-        reset_button_turtle.penup()
-        reset_button_turtle.goto(start_x, start_y)
-        reset_button_turtle.stamp()
-
-        # Quit Button
-        start_x += 70  # Position from the Reset Button
-        quit_button_turtle = turtle.Turtle()
-        quit_button_turtle.shape("quit.gif")
-        quit_button_turtle.penup()
-        quit_button_turtle.goto(start_x, start_y)
-        quit_button_turtle.stamp()
+        # Check, Reset and Quit Buttons, with their offset from the start.
+        if self.button_turtles is None:
+            self.button_turtles = []
+            for shape, offset in [("checkbutton.gif", 0), ("xbutton.gif", 40),
+                                  ("quit.gif", 110)]:
+                button_turtle = turtle.Turtle()
+                button_turtle.shape(shape)
+                button_turtle.penup()
+                button_turtle.goto(start_x + offset, start_y)
+                self.button_turtles.append(button_turtle)
+
+        for button_turtle in self.button_turtles:
+            button_turtle.clearstamps()
+            button_turtle.stamp()
+        start_x += 110  # Position of the Quit Button
 
         # Button locations for click detection
         self.button_locations['check'] = (start_x - 60, start_y)
         self.button_locations['reset'] = (start_x, start_y)
         self.button_locations['quit'] = (start_x + 70, start_y)
 
+    def hint_button(self):
+        """
+        Draws the hint button under the leaderboard frame.
+        """
+        self.rectangle(150, -145, 70, 27, "white")
+        self.drawer.goto(185, -167)
+        self.drawer.write("Hint", align="center", font=("Arial", 12, "bold"))
+
     # ***** ~ Pop-up Methods, Showing Message and Log Errors ~ *****
     def show_popup(self, gif_filename, display_time=5000):
         """
@@ -273,7 +366,7 @@ class MastermindGame:
             self.popup_turtle.hideturtle()
             self.popup_turtle.penup()
 
-        self.screen.addshape(gif_filename)
+        self.add_shape(gif_filename)
         self.popup_turtle.shape(gif_filename)
         self.popup_turtle.goto(0, 0)  # Center of the screen
 
@@ -290,10 +383,21 @@ class MastermindGame:
 
         self.screen.ontimer(hide_popup, display_time)
 
+    def add_shape(self, gif_filename):
+        """
+        Adds a GIF image as a shape, unless it was already added, so that
+        popups do not load a new copy of the image each time.
+        :param gif_filename: The name of the GIF file.
+        """
+        if gif_filename not in self.screen.getshapes():
+            self.screen.addshape(gif_filename)
+
     def get_name(self):
         """Prompts the player to enter their name and store it"""
         # Prevents overwriting an existing player name
         # Ensure the name requested only when necessary
+        if not self.interactive:
+            return
         if not hasattr(self, 'player_name') or not self.player_name:
             message = "Your name:"
             self.player_name = self.screen.textinput("CS 5001 Mastermind Code Game", message)
@@ -305,6 +409,11 @@ class MastermindGame:
         If player click to the cancel button quit the game and show quit popup
         :param secret_code: The secret code shown to the player.
         """
+        # Scripted sessions go on with a new game.
+        if not self.interactive:
+            self.start_new_game()
+            return
+
         # Convert secret code to string
         secret_code_str = ' '.join(secret_code)
         # Display the secret code and ask for the new game.
@@ -339,18 +448,22 @@ class MastermindGame:
         :param gif_filename: The gif to be used for the popup message.
         """
         # Add GIF image as a shape
-        self.screen.addshape(gif_filename)
-
-        message_turtle = turtle.Turtle()
-        message_turtle.hideturtle()
-        message_turtle.penup()
+        self.add_shape(gif_filename)
+
+        # One turtle is kept for all messages.
+        if self.message_turtle is None:
+            self.message_turtle = turtle.Turtle()
+            self.message_turtle.hideturtle()
+            self.message_turtle.penup()
+        message_turtle = self.message_turtle
         # Setting the Turtle shape to the gif image.
         message_turtle.shape(gif_filename)
         message_turtle.goto(0, 0)  # Center of the screen
-        message_turtle.stamp()  # Display the gif image
+        message_stamp = message_turtle.stamp()  # Display the gif image
 
         # Gif image displays for 5 second then clear
-        self.screen.ontimer(lambda: message_turtle.clear(), 5000)
+        self.screen.ontimer(
+            lambda: message_turtle.clearstamp(message_stamp), 5000)
 
     # ***** ~ Leaderboard Logic ~ *****
     def draw_leaderboard(self):
@@ -485,20 +598,71 @@ class MastermindGame:
 
     def draw_arrow_indicator(self, row):
         """
-        Places the arrow indicator at the selected row.
+        Places the arrow indicator at the selected row. Hides it while the
+        row is scrolled out of view.
         :param row: The row number arrow indicator should be placed.
         """
-        y_position = 250 - row * 40
-        self.arrow_indicator.goto(-220, y_position)
+        if row not in self.visible_row_range():
+            self.arrow_indicator.hideturtle()
+            return
+        self.arrow_indicator.goto(-220, self.row_y(row))
+        self.arrow_indicator.showturtle()
+
+    # ***** ~ Methods for Scrolling the Guess History ~ *****
+    def visible_row_range(self):
+        """
+        Returns the rows of the guess history shown in the guessing frame.
+        :return: range of row numbers.
+        """
+        count = min(self.visible_rows, self.num_guesses)
+        return range(self.scroll_offset, self.scroll_offset + count)
+
+    def row_y(self, row):
+        """
+        Returns the y position of a row of the guess history.
+        :param row: The row number.
+        :return: y position of the row's center.
+        """
+        return 250 - (row - self.scroll_offset) * 40
+
+    def scroll_to_row(self, row):
+        """
+        Moves the visible rows the least needed to show a row.
+        :param row: The row number to show.
+        """
+        rows = self.visible_row_range()
+        if row < rows.start:
+            self.scroll_offset = row
+        elif row >= rows.stop:
+            self.scroll_offset = row - len(rows) + 1
+        max_offset = max(0, self.num_guesses - self.visible_rows)
+        self.scroll_offset = max(0, min(self.scroll_offset, max_offset))
+
+    def scroll_history(self, step):
+        """
+        Scrolls the guess history by a number of rows and redraws the board.
+        :param step: Rows to scroll, negative to scroll up.
+        """
+        max_offset = max(0, self.num_guesses - self.visible_rows)
+        offset = max(0, min(self.scroll_offset + step, max_offset))
+        if offset == self.scroll_offset:
+            return
+        self.scroll_offset = offset
+        if len(self.guess_history) < self.num_guesses:
+            self.draw_arrow_indicator(len(self.guess_history))
+        self.update_game_board()
 
     def display_guess_history(self):
         """
         Displays the history of guesses along with their evaluations.
-        Each past guess, and its bulls and cows are drawn on the game board.
+        Each past guess in the visible rows, and its bulls and cows are
+        drawn on the game board.
         """
         start_x = -180
-        for i, (guess, bulls, cows) in enumerate(self.guess_history):
-            start_y = 250 - (i * 40)
+        rows = self.visible_row_range()
+        for i in range(rows.start, min(rows.stop, len(self.guess_history))):
+            guess, bulls, cows = self.guess_history[i]
+            start_y = self.row_y(i)
             # Nested loop iterate over each color in current guess
             for j, color in enumerate(guess):
                 self.circle(start_x + j * 40, start_y, 15, color)
@@ -512,11 +676,111 @@ class MastermindGame:
         Marks the players current guess to the game board. Visualizes each
         color in the current guess as a circle at a specific place.
         """
+        row = len(self.guess_history)
+        if row not in self.visible_row_range():
+            return
         start_x = -180
-        start_y = 250 - (len(self.guess_history) * 40)
+        start_y = self.row_y(row)
         for i, color in enumerate(self.current_guess):
             self.circle(start_x + i * 40, start_y, 15, color)
 
+    def draw_possibilities(self):
+        """
+        Writes the number of secret codes still consistent with the guess
+        history under the guessing frame.
+        """
+        self.drawer.goto(-225, -168)
+        self.drawer.write(
+            f"Possible codes: {self.possibilities_remaining()}",
+            align="left", font=("Arial", 12, "normal")
+        )
+
+    def draw_possible_codes(self):
+        """
+        Draws the first codes still consistent with the guess history
+        inside the leaderboard frame, under the leaders, when
+        show_possible_codes is set.
+        """
+        if not self.show_possible_codes:
+            return
+        font_settings = ("Arial", 12, "normal")
+        self.drawer.goto(60, 20)
+        self.drawer.write("Possible:", align="left", font=font_settings)
+        codes = self.possible_codes(self.possible_codes_shown)
+        for row, code in enumerate(codes):
+            for i, color in enumerate(code):
+                self.circle(70 + i * 20, 5 - row * 20, 6, color)
+        hidden = self.possibilities_remaining() - len(codes)
+        if hidden > 0:
+            self.drawer.goto(60, -125)
+            self.drawer.write(f"+{hidden} more", align="left", font=font_settings)
+
+    # ***** ~ Methods for Candidate Codes ~ *****
+    def update_candidates(self, guess, bulls, cows):
+        """
+        Narrows the candidate codes down to those consistent with a guess.
+        :param guess: List for the users guess.
+        :param bulls: Number of bulls for the guess.
+        :param cows: Number of cows for the guess.
+        """
+        code_space = get_code_space(self.colors, self.guess_spots)
+        if self.candidates is None:
+            self.candidates = code_space.all_codes
+        self.candidates = code_space.filter(self.candidates, guess, bulls, cows)
+
+    def adversary_feedback(self, guess):
+        """
+        Answers a guess in evil mode. Splits the candidate codes by the
+        feedback they would give and keeps the largest group, avoiding a
+        win whenever another group is as large. The secret code becomes a
+        code of that group, so it always matches the guess history.
+        :param guess: List for the users guess.
+        :return: Tuple containing number of bulls and cows.
+        """
+        code_space = get_code_space(self.colors, self.guess_spots)
+        if self.candidates is None:
+            self.candidates = code_space.all_codes
+        groups = code_space.partition(guess, self.candidates)
+
+        # Largest group first, then no win, then fewer bulls and cows.
+        bulls, cows = max(
+            groups, key=lambda result: (
+                groups[result].bit_count(), result[0] != self.guess_spots,
+                -result[0], -result[1]
+            )
+        )
+        self.candidates = groups[(bulls, cows)]
+        self.secret_code = code_space.decode(self.candidates, 1)[0]
+        return bulls, cows
+
+    def possibilities_remaining(self):
+        """
+        Counts the secret codes still consistent with the guess history.
+        :return: Number of remaining codes.
+        """
+        if self.candidates is None:
+            return len(get_code_space(self.colors, self.guess_spots).codes)
+        return self.candidates.bit_count()
+
+    def possible_codes(self, limit=None):
+        """
+        Lists the secret codes still consistent with the guess history.
+        :param limit: Maximum number of codes to list. All when None.
+        :return: List of codes, each a list of colors.
+        """
+        code_space = get_code_space(self.colors, self.guess_spots)
+        if self.candidates is None:
+            return code_space.decode(code_space.all_codes, limit)
+        return code_space.decode(self.candidates, limit)
+
+    def new_secret_code(self):
+        """
+        Draws a new secret code of distinct colors from the global random
+        generator. Tournament games pass a seeded code instead.
+        :return: List of colors for the secret code.
+        """
+        return random.sample(self.colors, self.guess_spots)
+
     def check_guess(self, guess):
         """
         This method evaluate the guess against secret code.
@@ -553,17 +817,25 @@ class MastermindGame:
             return
 
         # Calculate bulls and cows.
-        bulls, cows = self.check_guess(self.current_guess)
+        if self.evil_mode:
+            # The adversary narrows the candidate codes itself.
+            bulls, cows = self.adversary_feedback(self.current_guess)
+        else:
+            bulls, cows = self.check_guess(self.current_guess)
+            self.update_candidates(self.current_guess, bulls, cows)
 
         # Update guess history and scoring pegs.
         self.guess_history.append((self.current_guess, bulls, cows))
         self.scoring_pegs(bulls, cows, len(self.guess_history) - 1)
 
-        # Move the arrow only if the number of guesses less than 10.
+        # Move the arrow only if there are guesses left, scrolling the
+        # history to keep the next row in view.
         if len(self.guess_history) < self.num_guesses:
+            self.scroll_to_row(len(self.guess_history))
             self.draw_arrow_indicator(len(self.guess_history))
 
         self.current_guess = []
+        self.cancel_hint()
         self.update_game_board()
 
         # Check if the game is over.
@@ -590,8 +862,73 @@ class MastermindGame:
         """
         if 80 <= x <= 120 and -230 <= y <= -190:
             self.current_guess = []
+            self.cancel_hint()
             self.update_game_board()
 
+    # ***** ~ Hint Methods ~ *****
+    def draw_hint(self):
+        """
+        Writes the hint text, or the progress of the running hint search,
+        next to the hint button. Uses its own turtle so that progress can be
+        updated without redrawing the game board.
+        """
+        self.hint_drawer.clear()
+        self.hint_drawer.goto(-80, -168)
+        self.hint_drawer.write(
+            self.hint_text, align="left", font=("Arial", 12, "normal")
+        )
+        self.screen.update()
+
+    def request_hint(self):
+        """
+        Starts a background search for the best guess starting with the
+        colors of the current guess, and polls for its result.
+        """
+        if self.hint_worker.is_active():
+            return
+        self.hint_worker.submit(
+            self.colors, self.guess_spots, self.guess_history,
+            self.current_guess
+        )
+        self.hint_request += 1
+        self.hint_text = "Hint: 0%"
+        self.draw_hint()
+        request = self.hint_request
+        self.screen.ontimer(lambda: self.poll_hint(request), 100)
+
+    def poll_hint(self, request):
+        """
+        Checks the background hint search from the event loop. Shows the
+        hint when it is done, the progress otherwise. Stops polling when
+        the request was cancelled or replaced by a newer one, so only one
+        poll runs at a time.
+        :param request: Number of the hint request being polled.
+        """
+        if request != self.hint_request or not self.hint_worker.is_active():
+            return
+        done, guess = self.hint_worker.result()
+        if done:
+            if guess is None:
+                self.hint_text = "No hint found"
+            else:
+                self.hint_text = "Hint: " + ' '.join(guess)
+        else:
+            self.hint_text = f"Hint: {int(self.hint_worker.progress * 100)}%"
+            self.screen.ontimer(lambda: self.poll_hint(request), 100)
+        self.draw_hint()
+
+    def cancel_hint(self):
+        """
+        Cancels the running hint search and clears the hint, since it no
+        longer matches the current guess.
+        """
+        if self.hint_worker is None:
+            return
+        self.hint_worker.cancel()
+        if self.hint_text:
+            self.hint_text = ""
+            self.draw_hint()
+
 # ***** ~ Click Events ~ *****
     def click_in_button(self, x, y, button):
         """
@@ -633,6 +970,7 @@ class MastermindGame:
                     return
                 if color not in self.current_guess:
                     self.current_guess.append(color)
+                    self.cancel_hint()
                     self.circle(bx, by, self.radius, "white")
                     self.update_game_board()
 
@@ -655,6 +993,12 @@ class MastermindGame:
             self.reset_guess(x, y)
         elif self.click_in_button(x, y, self.button_locate["quit"]):
             self.quit_button_click()
+        elif self.click_in_button(x, y, self.button_locate["hint"]):
+            self.request_hint()
+        elif self.click_in_button(x, y, self.button_locate["scroll_up"]):
+            self.scroll_history(-1)
+        elif self.click_in_button(x, y, self.button_locate["scroll_down"]):
+            self.scroll_history(1)
         else:
             self.color_click(x, y)
 
@@ -676,11 +1020,15 @@ class MastermindGame:
         self.guessing_frame()
         self.color_buttons()
         self.gif_buttons()
+        self.hint_button()
         self.draw_current_guess()
         self.display_guess_history()
+        self.draw_possibilities()
         self.draw_leaderboard()
+        self.draw_possible_codes()
         self.display_leaderboard()
         self.screen.update()
+        self.accounting.record_refresh(self.games_played)
 
     def initialize_game_board(self):
         """Initialize the main components of the game board"""
@@ -729,12 +1077,17 @@ class MastermindGame:
             self.popup_turtle.hideturtle()
 
         # Reset the game
+        self.cancel_hint()
         self.current_guess = []
         self.guess_history = []
-        self.secret_code = random.sample(self.colors, self.guess_spots)
+        self.candidates = None
+        self.secret_code = self.new_secret_code()
+        self.scroll_offset = 0
+        self.draw_arrow_indicator(0)
 
         # Prompt for the player name
-        self.player_name = None
+        if self.interactive:
+            self.player_name = None
         self.get_name()
 
         # Initialize the leaderboard with the new player.
@@ -742,6 +1095,8 @@ class MastermindGame:
 
         # Draw the game board.
         self.update_game_board()
+        self.accounting.record_game(self.games_played)
+        self.games_played += 1
 
     def reset_game(self):
         """
@@ -753,21 +1108,50 @@ class MastermindGame:
             self.popup_turtle.clearstamps()
             self.popup_turtle.hideturtle()
 
+        self.cancel_hint()
         self.current_guess = []
         self.guess_history = []
-        self.secret_code = random.sample(self.colors, self.guess_spots)
+        self.candidates = None
+        self.secret_code = self.new_secret_code()
+        self.scroll_offset = 0
+        self.draw_arrow_indicator(0)
         self.update_game_board()
+        self.accounting.record_game(self.games_played)
+        self.games_played += 1
+
+    def start_session(self, player_name):
+        """
+        Starts the game graphics for a scripted session: no prompts, no
+        leaderboard error popup and no main loop, so the caller drives the
+        game and the event loop itself.
+        :param player_name: The name of the player for the session.
+        """
+        self.interactive = False
+        self.player_name = player_name
+        self.game_graphics(start=False)
+        self.initialize_game_board()
+        self.arrow_indicator.showturtle()
 
     def quit_game(self):
         """
-        Quit game and closes the game window.
+        Quit game, dumps the board accounting and closes the game window.
+        Also called when the window is closed from its title bar.
         """
+        self.hint_worker.shutdown()
+        self.accounting.dump(self.accounting_file)
         self.screen.bye()
 
 
 # Main function to start the game.
 def main():
-    game = MastermindGame()
+    parser = argparse.ArgumentParser(description="Mastermind code game")
+    parser.add_argument("--evil", action="store_true",
+                        help="play against the adversarial opponent")
+    parser.add_argument("--show-possible-codes", action="store_true",
+                        help="list codes still possible on the board")
+    args = parser.parse_args()
+    game = MastermindGame(evil_mode=args.evil,
+                          show_possible_codes=args.show_possible_codes)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,195 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from mastermind_candidates import get_code_space
+from mastermind_symmetry import canonical_candidates, canonicalize, restore_guess
+
+
+# ***** ~ Solver ~ *****
+def best_guess(code_space, candidates, prefix=(), progress=None, cancelled=None):
+    """
+    Finds the guess that leaves the fewest candidate codes in the worst case
+    (minimax). Only guesses starting with the given prefix are considered,
+    so a hint can complete the colors already picked by the player. Ties
+    prefer guesses that can still be the secret code.
+    :param code_space: The CodeSpace of the game.
+    :param candidates: Bitset of codes consistent with the guess history.
+    :param prefix: Colors the guess must start with.
+    :param progress: Optional callable receiving the fraction done.
+    :param cancelled: Optional callable returning True to stop the search.
+    :return: The best guess as a list of colors, or None when cancelled
+    or when no guess starts with the prefix.
+    """
+    prefix = tuple(prefix)
+    guesses = [
+        i for i, code in enumerate(code_space.codes)
+        if code[:len(prefix)] == prefix
+    ]
+
+    best = None
+    best_key = None
+    for count, guess in enumerate(guesses):
+        if cancelled is not None and cancelled():
+            return None
+        if progress is not None and count % 32 == 0:
+            progress(count / len(guesses))
+
+        # Size of the largest group of candidates sharing a feedback.
+        groups = code_space.partition(code_space.codes[guess], candidates)
+        worst = max((mask.bit_count() for mask in groups.values()), default=0)
+
+        # Smaller is better: worst case, then possible secret, then order.
+        key = (worst, not (candidates >> guess) & 1, guess)
+        if best_key is None or key < best_key:
+            best = guess
+            best_key = key
+            if worst <= 1 and (candidates >> guess) & 1:
+                break  # Cannot do better than a possible winning guess.
+
+    if progress is not None:
+        progress(1.0)
+    if best is None:
+        return None
+    return list(code_space.codes[best])
+
+
+class SolverCache:
+    """
+    This class remembers solver results by the canonical form of the game
+    state, so states that only differ by renamed colors or reordered pegs
+    are solved once.
+    """
+    def __init__(self):
+        """Creates an empty cache."""
+        self.results = {}
+        self.hits = 0
+        self.misses = 0
+
+    def best_guess(self, colors, guess_spots, history, prefix=(),
+                   progress=None, cancelled=None):
+        """
+        Finds the best guess for a game state. Hints that must start with
+        a prefix depend on the real colors and are solved directly.
+        :param colors: The palette of colors.
+        :param guess_spots: Number of pegs in a code.
+        :param history: List of (guess, bulls, cows) tuples.
+        :param prefix: Colors the guess must start with.
+        :param progress: Optional callable receiving the fraction done.
+        :param cancelled: Optional callable returning True to stop.
+        :return: The best guess as a list of colors, or None.
+        """
+        if prefix:
+            code_space = get_code_space(colors, guess_spots)
+            candidates = code_space.all_codes
+            for guess, bulls, cows in history:
+                candidates = code_space.filter(candidates, guess, bulls, cows)
+            return best_guess(
+                code_space, candidates, prefix, progress, cancelled
+            )
+
+        key, transform = canonicalize(colors, guess_spots, history)
+        guess = self.results.get(key)
+        if guess is None:
+            self.misses += 1
+            code_space, candidates = canonical_candidates(key)
+            guess = best_guess(
+                code_space, candidates, (), progress, cancelled
+            )
+            if guess is None:
+                return None
+            self.results[key] = guess
+        else:
+            self.hits += 1
+            if progress is not None:
+                progress(1.0)
+        return restore_guess(colors, transform, guess)
+
+
+# ***** ~ Background Hint Worker ~ *****
+class HintWorker:
+    """
+    This class runs hint searches on a background thread, so the turtle
+    window keeps responding while the solver works. Only one request is
+    active at a time: submitting a new request or calling cancel() marks the
+    previous one as cancelled, the solver stops at its next check and its
+    result is never delivered. The UI polls result() with screen.ontimer.
+    """
+    def __init__(self, log_error=None):
+        """
+        Creates the worker with a single background thread.
+        :param log_error: Optional callable receiving the message of a
+        failed hint search.
+        """
+        self.log_error = log_error
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.cache = SolverCache()
+        self.future = None
+        self.cancel_event = None
+        self.progress = 0.0
+
+    def submit(self, colors, guess_spots, history, prefix=()):
+        """
+        Starts a new hint search, cancelling the previous one.
+        :param colors: The palette of colors.
+        :param guess_spots: Number of pegs in a code.
+        :param history: List of (guess, bulls, cows) tuples.
+        :param prefix: Colors the hint must start with.
+        """
+        self.cancel()
+        cancel_event = threading.Event()
+
+        def report(fraction):
+            # Progress of a cancelled request is ignored.
+            if not cancel_event.is_set():
+                self.progress = fraction
+
+        self.cancel_event = cancel_event
+        self.future = self.executor.submit(
+            self.cache.best_guess, list(colors), guess_spots, list(history),
+            tuple(prefix), report, cancel_event.is_set
+        )
+
+    def cancel(self):
+        """Cancels the active request, if any."""
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+            self.future.cancel()
+        self.cancel_event = None
+        self.future = None
+        self.progress = 0.0
+
+    def is_active(self):
+        """
+        Checks if a request is waiting for its result.
+        :return: bool: True if a request is active. False otherwise.
+        """
+        return self.future is not None
+
+    def result(self):
+        """
+        Takes the result of the active request once it is done.
+        :return: Tuple (done, guess). done is False while the search is
+        still running. guess is None if no hint could be found, or if the
+        search failed.
+        """
+        if self.future is None or not self.future.done():
+            return False, None
+        try:
+            guess = self.future.result()
+        except Exception as e:
+            guess = None
+            if self.log_error is not None:
+                self.log_error(f"Hint search failed: {e!r}")
+        self.cancel_event = None
+        self.future = None
+        self.progress = 0.0
+        return True, guess
+
+    def shutdown(self):
+        """
+        Cancels the active request and stops the background thread. A
+        running search stops at its next check, so the process does not
+        wait for it to finish on exit.
+        """
+        self.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
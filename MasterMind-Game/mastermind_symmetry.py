@@ -0,0 +1,177 @@
+import itertools
+import math
+
+from mastermind_candidates import get_code_space
+
+
+# ***** ~ Canonical States ~ *****
+def canonical_history(history, guess_spots):
+    """
+    Finds the canonical form of a guess history. Renaming the colors or
+    reordering the pegs of every guess the same way gives an equivalent
+    game, so the history is rewritten for every order of the pegs with the
+    colors renamed 0, 1, 2, ... in order of first appearance, and the
+    smallest result is kept.
+    :param history: List of (guess, bulls, cows) tuples.
+    :param guess_spots: Number of pegs in a code.
+    :return: Tuple of the canonical history, the peg order used and the
+    dictionary of color to label.
+    """
+    best = None
+    best_order = None
+    best_labels = None
+    for order in itertools.permutations(range(guess_spots)):
+        labels = {}
+        form = []
+        for guess, bulls, cows in history:
+            relabeled = []
+            for position in order:
+                color = guess[position]
+                if color not in labels:
+                    labels[color] = len(labels)
+                relabeled.append(labels[color])
+            form.append((tuple(relabeled), bulls, cows))
+        form = tuple(form)
+        if best is None or form < best:
+            best = form
+            best_order = order
+            best_labels = labels
+    return best, best_order, best_labels
+
+
+def canonicalize(colors, guess_spots, history):
+    """
+    Maps a game state to its canonical key. Equivalent states share the
+    same key, so results computed for one can be reused for the others.
+    :param colors: The palette of colors.
+    :param guess_spots: Number of pegs in a code.
+    :param history: List of (guess, bulls, cows) tuples.
+    :return: Tuple of the key and the transform needed by restore_guess().
+    """
+    form, order, labels = canonical_history(history, guess_spots)
+    key = (len(colors), guess_spots, form)
+    return key, (order, labels)
+
+
+def restore_guess(colors, transform, canonical_guess):
+    """
+    Maps a guess written with canonical labels back to the colors and peg
+    order of the original state. Labels not used by the history stand for
+    any unused color, so they are given the unused colors in order.
+    :param colors: The palette of colors.
+    :param transform: The transform returned by canonicalize().
+    :param canonical_guess: Guess as a sequence of color labels.
+    :return: The guess as a list of colors.
+    """
+    order, labels = transform
+    names = {label: color for color, label in labels.items()}
+    unused = [color for color in colors if color not in labels]
+    for label in range(len(labels), len(colors)):
+        names[label] = unused[label - len(labels)]
+
+    guess = [None] * len(order)
+    for position, label in zip(order, canonical_guess):
+        guess[position] = names[label]
+    return guess
+
+
+def canonical_candidates(key):
+    """
+    Finds the codes consistent with a canonical state, in the code space
+    of color labels.
+    :param key: A key returned by canonicalize().
+    :return: Tuple of the label CodeSpace and the bitset of candidates.
+    """
+    num_colors, guess_spots, form = key
+    code_space = get_code_space(range(num_colors), guess_spots)
+    candidates = code_space.all_codes
+    for guess, bulls, cows in form:
+        candidates = code_space.filter(candidates, guess, bulls, cows)
+    return code_space, candidates
+
+
+# ***** ~ Reduction Report ~ *****
+def orbit_size(num_colors, guess_spots, form):
+    """
+    Counts the states equivalent to a canonical history: the size of the
+    symmetry group divided by the number of symmetries that leave the
+    history unchanged.
+    :param num_colors: Number of colors in the palette.
+    :param guess_spots: Number of pegs in a code.
+    :param form: A canonical history.
+    :return: Number of equivalent states.
+    """
+    used = len({label for guess, _, _ in form for label in guess})
+    fixed_orders = 0
+    for order in itertools.permutations(range(guess_spots)):
+        labels = {}
+        for guess, _, _ in form:
+            for position in order:
+                labels.setdefault(guess[position], len(labels))
+        relabeled = tuple(
+            (tuple(labels[guess[p]] for p in order), bulls, cows)
+            for guess, bulls, cows in form
+        )
+        if relabeled == form:
+            fixed_orders += 1
+
+    group = math.factorial(num_colors) * math.factorial(guess_spots)
+    return group // (fixed_orders * math.factorial(num_colors - used))
+
+
+def reduction_report(num_colors, guess_spots, depth):
+    """
+    Counts the game states reachable after each number of guesses, with
+    and without symmetry reduction. A state is a guess history that at
+    least one secret code agrees with.
+    :param num_colors: Number of colors in the palette.
+    :param guess_spots: Number of pegs in a code.
+    :param depth: Number of guesses to explore.
+    :return: List of (guesses, states, canonical states, reduction factor)
+    tuples, one per number of guesses.
+    """
+    code_space = get_code_space(range(num_colors), guess_spots)
+    level = {(): code_space.all_codes}
+    report = []
+    for guesses in range(1, depth + 1):
+        next_level = {}
+        for form, candidates in level.items():
+            expanded = set()
+            for guess in code_space.codes:
+                # Equivalent guesses lead to equivalent states.
+                pending = form + ((guess, None, None),)
+                pending_form = canonical_history(pending, guess_spots)[0]
+                if pending_form in expanded:
+                    continue
+                expanded.add(pending_form)
+
+                groups = code_space.partition(guess, candidates)
+                for bulls, cows in groups:
+                    history = form + ((guess, bulls, cows),)
+                    child = canonical_history(history, guess_spots)[0]
+                    if child not in next_level:
+                        next_level[child] = canonical_candidates(
+                            (num_colors, guess_spots, child)
+                        )[1]
+        level = next_level
+
+        states = sum(
+            orbit_size(num_colors, guess_spots, form) for form in level
+        )
+        report.append((guesses, states, len(level), states / len(level)))
+    return report
+
+
+def main():
+    """Prints the reduction factor for the standard game and larger ones."""
+    for num_colors, guess_spots, depth in [(6, 4, 2), (8, 4, 1), (8, 5, 1)]:
+        for guesses, states, canonical, factor in reduction_report(
+                num_colors, guess_spots, depth):
+            print(
+                f"{num_colors} colors, {guess_spots} pegs, {guesses} guesses: "
+                f"{states} states, {canonical} canonical, {factor:.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
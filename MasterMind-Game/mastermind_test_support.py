@@ -0,0 +1,47 @@
+import os
+import tempfile
+import tkinter
+import unittest
+from mastermind_driver import start_scripted_session
+
+
+def display_available():
+    """
+    Checks if a window can be opened for the turtle screen.
+    :return: bool: True if a display is available. False otherwise.
+    """
+    try:
+        root = tkinter.Tk()
+    except tkinter.TclError:
+        return False
+    root.destroy()
+    return True
+
+
+class SessionTestCase(unittest.TestCase):
+    """
+    Base class for tests that play on the real board. Before each test it
+    starts a scripted session with its files in a temporary directory, and
+    closes it afterwards.
+    """
+    player_name = "Session"
+    # Keyword arguments for MastermindGame.
+    game_options = {}
+
+    def setUp(self):
+        """
+        Starts a scripted session with its files in a temporary directory.
+        """
+        self.cwd = os.getcwd()
+        # The GIF files are loaded from the game directory.
+        os.chdir(os.path.dirname(os.path.abspath(__file__)))
+        self.directory = tempfile.TemporaryDirectory()
+        self.game = start_scripted_session(
+            self.player_name, self.directory.name, **self.game_options
+        )
+
+    def tearDown(self):
+        """Closes the session and removes its files."""
+        self.game.quit_game()
+        self.directory.cleanup()
+        os.chdir(self.cwd)
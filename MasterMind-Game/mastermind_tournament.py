@@ -0,0 +1,234 @@
+import hashlib
+import random
+
+from mastermind_game import MastermindGame
+
+
+# ***** ~ Seeded Secret Generation ~ *****
+def _seed_hasher(seed):
+    """
+    Creates the keyed hash that all streams of a seed are derived from.
+    :param seed: The parent seed (a non-negative integer).
+    :return: A blake2b hash object keyed with the seed.
+    """
+    return hashlib.blake2b(digest_size=8, key=str(seed).encode())
+
+
+def derive_seed(seed, *keys):
+    """
+    Derives an independent 64 bit seed from a parent seed and a path of
+    integer keys. Works like spawning a child stream: the same parent and
+    keys always give the same child, and different keys give unrelated ones.
+    :param seed: The parent seed (a non-negative integer).
+    :param keys: Integer keys identifying the child stream.
+    :return: The child seed as an integer.
+    """
+    hasher = _seed_hasher(seed)
+    for key in keys:
+        hasher.update(key.to_bytes(8, "little"))
+    return int.from_bytes(hasher.digest(), "little")
+
+
+def count_codes(num_colors, guess_spots):
+    """
+    Counts the secret codes of distinct colors for a configuration.
+    :param num_colors: Number of colors in the palette.
+    :param guess_spots: Number of pegs in a code.
+    :return: Number of possible secret codes.
+    """
+    total = 1
+    for i in range(guess_spots):
+        total *= num_colors - i
+    return total
+
+
+def code_blocks(num_colors, guess_spots):
+    """
+    Counts, for each peg, the codes that share all pegs up to that one.
+    :param num_colors: Number of colors in the palette.
+    :param guess_spots: Number of pegs in a code.
+    :return: List with one count per peg.
+    """
+    return [
+        count_codes(num_colors - i - 1, guess_spots - i - 1)
+        for i in range(guess_spots)
+    ]
+
+
+def unrank_code(rank, colors, guess_spots, blocks=None):
+    """
+    Converts an integer into the secret code with that position in the
+    lexicographic order of itertools.permutations(colors, guess_spots).
+    :param rank: Position of the code, from 0 to count_codes() - 1.
+    :param colors: The palette of colors.
+    :param guess_spots: Number of pegs in a code.
+    :param blocks: Counts from code_blocks(), computed when None.
+    :return: List of colors for the code.
+    """
+    if blocks is None:
+        blocks = code_blocks(len(colors), guess_spots)
+    pool = list(colors)
+    code = []
+    for block in blocks:
+        digit, rank = divmod(rank, block)
+        code.append(pool.pop(digit))
+    return code
+
+
+def generate_secrets(seed, num_games, colors, guess_spots, start=0):
+    """
+    Generates the secret codes for a block of games in one call. Game i gets
+    its own stream derived from (seed, i), so any game can be regenerated on
+    its own and workers can split the games without sharing any state.
+    :param seed: The tournament seed.
+    :param num_games: Number of games to generate.
+    :param colors: The palette of colors.
+    :param guess_spots: Number of pegs in a code.
+    :param start: Index of the first game in the block.
+    :return: List of secret codes, one per game.
+    """
+    num_codes = count_codes(len(colors), guess_spots)
+    blocks = code_blocks(len(colors), guess_spots)
+    return [
+        unrank_code(derive_seed(seed, index) % num_codes,
+                    colors, guess_spots, blocks)
+        for index in range(start, start + num_games)
+    ]
+
+
+def secret_code_for_game(seed, game_index, colors, guess_spots):
+    """
+    Reproduces the secret code of a single tournament game.
+    :param seed: The tournament seed.
+    :param game_index: Index of the game in the tournament.
+    :param colors: The palette of colors.
+    :param guess_spots: Number of pegs in a code.
+    :return: List of colors for the secret code.
+    """
+    return generate_secrets(seed, 1, colors, guess_spots, game_index)[0]
+
+
+# ***** ~ Tournament ~ *****
+class Tournament:
+    """
+    This class runs a Mastermind tournament where every player plays the
+    same number of rounds. All secret codes are generated up front from a
+    single tournament seed, so the whole tournament (or any one game of it)
+    can be replayed. Scores follow the leaderboard rule: the number of
+    guesses made, where the smallest total ranks first.
+    """
+    def __init__(self, player_names, num_rounds, seed=None):
+        """
+        Creates a new tournament and pre-generates the secret codes for
+        every player and round.
+        :param player_names: List of player names.
+        :param num_rounds: Number of rounds each player plays.
+        :param seed: The tournament seed. A random seed is chosen and kept
+        in self.seed when None.
+        """
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        self.seed = seed
+        self.player_names = list(player_names)
+        self.num_rounds = num_rounds
+
+        # Game configuration is taken from the standard game.
+        self.colors = list(MastermindGame.COLORS)
+        self.guess_spots = MastermindGame.GUESS_SPOTS
+        self.num_guesses = MastermindGame.NUM_GUESSES
+
+        # Secret codes for all players x rounds in one call.
+        secrets = generate_secrets(
+            self.seed, len(self.player_names) * num_rounds,
+            self.colors, self.guess_spots
+        )
+        self.secrets = [
+            secrets[i * num_rounds:(i + 1) * num_rounds]
+            for i in range(len(self.player_names))
+        ]
+        self.scores = [[None] * num_rounds for _ in self.player_names]
+
+    def game_index(self, player, round_number):
+        """
+        Returns the tournament wide index of a game.
+        :param player: Index of the player.
+        :param round_number: Index of the round.
+        :return: The game index used to derive the secret code.
+        """
+        return player * self.num_rounds + round_number
+
+    def worker_games(self, worker, num_workers):
+        """
+        Splits the tournament games between workers. Each worker can
+        generate its own secrets with generate_secrets() from the returned
+        start index, independent of the other workers.
+        :param worker: Index of the worker.
+        :param num_workers: Total number of workers.
+        :return: Tuple of the first game index and the number of games.
+        """
+        total = len(self.player_names) * self.num_rounds
+        size, extra = divmod(total, num_workers)
+        start = worker * size + min(worker, extra)
+        return start, size + (1 if worker < extra else 0)
+
+    def new_game(self, player, round_number):
+        """
+        Creates a game without graphics for a player and round, using the
+        pre-generated secret code.
+        :param player: Index of the player.
+        :param round_number: Index of the round.
+        :return: A MastermindGame in test mode.
+        """
+        game = MastermindGame(
+            test_mode=True, secret_code=self.secrets[player][round_number]
+        )
+        game.colors = self.colors
+        game.guess_spots = self.guess_spots
+        game.num_guesses = self.num_guesses
+        return game
+
+    def play_game(self, player, round_number, strategy):
+        """
+        Plays one game with a strategy and records its score.
+        :param player: Index of the player.
+        :param round_number: Index of the round.
+        :param strategy: Callable taking the game and returning the next
+        guess as a list of colors.
+        :return: The score of the game.
+        """
+        game = self.new_game(player, round_number)
+        while len(game.guess_history) < game.num_guesses:
+            guess = list(strategy(game))
+            bulls, cows = game.check_guess(guess)
+            game.guess_history.append((guess, bulls, cows))
+            if bulls == game.guess_spots:
+                break
+
+        score = game.calculate_score()
+        self.scores[player][round_number] = score
+        return score
+
+    def play(self, strategies):
+        """
+        Plays every round for every player.
+        :param strategies: Dictionary of player name to strategy callable.
+        """
+        for player, name in enumerate(self.player_names):
+            for round_number in range(self.num_rounds):
+                self.play_game(player, round_number, strategies[name])
+
+    def rankings(self):
+        """
+        Ranks the players by their total score. A round not played yet
+        scores num_guesses, the worst score, so a partly played tournament
+        never ranks a player ahead for the rounds they missed.
+        :return: List of (name, total score) tuples in ascending order.
+        """
+        totals = []
+        for name, scores in zip(self.player_names, self.scores):
+            total = sum(
+                self.num_guesses if s is None else s for s in scores
+            )
+            totals.append((name, total))
+        totals.sort(key=lambda x: (x[1], x[0]))
+        return totals
@@ -0,0 +1,129 @@
+import tracemalloc
+import unittest
+from types import SimpleNamespace
+from mastermind_accounting import (
+    BoardAccounting, count_board_items, grows_without_bound
+)
+from mastermind_test_support import SessionTestCase, display_available
+
+
+class TestGrowthCheck(unittest.TestCase):
+    """
+    This test class possesses unit tests for the check that tells bounded
+    per game values from values that keep growing.
+    """
+    def test_grows_without_bound(self):
+        """
+        Checks steady, leveling off and growing series of values.
+        """
+        self.assertFalse(grows_without_bound([50] * 20))
+        self.assertFalse(grows_without_bound([10, 40, 48, 50, 50, 49, 50, 50]))
+        self.assertTrue(grows_without_bound(list(range(50, 70))))
+        # Small noise is allowed by the tolerance.
+        self.assertFalse(grows_without_bound([100, 104, 101, 106], 10))
+        self.assertFalse(grows_without_bound([7]))
+
+
+class TestBoardCounts(unittest.TestCase):
+    """
+    This test class possesses unit tests for the counting of board items,
+    on a stand-in for the turtle screen so they run without a display.
+    """
+    def setUp(self):
+        """
+        Creates a screen with two turtles, three stamps and five canvas
+        items before each test.
+        """
+        self.items = [1, 2, 3, 4, 5]
+        canvas = SimpleNamespace(find_all=lambda: tuple(self.items))
+        self.turtles = [
+            SimpleNamespace(stampItems=[1, 2]),
+            SimpleNamespace(stampItems=[3])
+        ]
+        self.screen = SimpleNamespace(
+            turtles=lambda: list(self.turtles), getcanvas=lambda: canvas
+        )
+
+    def test_count_board_items(self):
+        """
+        Checks the counts of turtles, canvas items and stamps.
+        """
+        self.assertEqual(count_board_items(self.screen),
+                         {"turtles": 2, "canvas_items": 5, "stamps": 3})
+
+    def test_accounting_samples(self):
+        """
+        Checks that refreshes and games are recorded with their counts and
+        that only the latest refreshes are kept.
+        """
+        accounting = BoardAccounting(self.screen, max_samples=2)
+        self.assertIsNone(accounting.latest())
+        for game_number in range(3):
+            accounting.record_refresh(game_number)
+        self.assertEqual(len(accounting.refreshes), 2)
+
+        self.items.append(6)
+        self.turtles.append(SimpleNamespace(stampItems=[]))
+        accounting.record_refresh(3)
+        accounting.record_game(3)
+        expected = {"game": 3, "turtles": 3, "canvas_items": 6, "stamps": 3}
+        self.assertEqual(accounting.latest(), expected)
+        self.assertEqual(accounting.games, [expected])
+        self.assertIn("Game 3:", accounting.report())
+
+
+@unittest.skipUnless(display_available(), "needs a display for the turtle screen")
+class TestLongSession(SessionTestCase):
+    """
+    This test class plays many games in one session on the real board and
+    fails if turtles, canvas items, stamps or memory keep growing from one
+    game to the next.
+    """
+    num_games = 30
+    player_name = "Session"
+    game_options = {"trace_memory": True}
+
+    def tearDown(self):
+        """Closes the session and stops tracing memory."""
+        super().tearDown()
+        tracemalloc.stop()
+
+    def play_game(self, win):
+        """
+        Plays one game to its end with the same guesses every time.
+        :param win: Boolean flag to guess the secret code at the end.
+        """
+        colors = self.game.colors
+        wrong_guesses = [colors[:4], colors[2:], colors[1:5]]
+        while True:
+            if win and len(self.game.guess_history) == 3:
+                guess = list(self.game.secret_code)
+            else:
+                guess = list(wrong_guesses[len(self.game.guess_history) % 3])
+                if guess == self.game.secret_code:
+                    guess.reverse()
+            games_played = self.game.games_played
+            self.game.current_guess = guess
+            self.game.confirm_guess()
+            self.game.screen.getcanvas().update()
+            if self.game.games_played > games_played:
+                return
+
+    def test_long_session(self):
+        """
+        Checks that board items and memory level off over many games.
+        """
+        for number in range(self.num_games):
+            self.play_game(win=number % 2 == 0)
+
+        games = self.game.accounting.games
+        self.assertEqual(len(games), self.num_games)
+        for key in ["turtles", "canvas_items", "stamps"]:
+            values = [sample[key] for sample in games]
+            self.assertFalse(grows_without_bound(values), f"{key}: {values}")
+        memory = [sample["memory"] for sample in games]
+        self.assertFalse(grows_without_bound(memory, 256 * 1024), memory)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from mastermind_game import MastermindGame
+from mastermind_candidates import CodeSpace
+
+
+class TestMastermindCandidates(unittest.TestCase):
+    """
+    This test class possesses unit tests for the candidate codes. It checks
+    that filtering with the precomputed feedback masks keeps exactly the
+    codes that re-scoring with check_guess would keep.
+    """
+    def setUp(self):
+        """
+        Initializes the game in test mode with a preselected secret code.
+        """
+        self.game = MastermindGame(test_mode=True)
+        self.game.secret_code = ["black", "red", "purple", "blue"]
+        self.code_space = CodeSpace(self.game.colors, self.game.guess_spots)
+
+    def consistent_codes(self):
+        """
+        Finds the consistent codes by scoring every code against the guess
+        history with check_guess.
+        :return: List of consistent codes.
+        """
+        checker = MastermindGame(test_mode=True)
+        codes = []
+        for code in self.code_space.codes:
+            checker.secret_code = list(code)
+            if all(checker.check_guess(guess) == (bulls, cows)
+                   for guess, bulls, cows in self.game.guess_history):
+                codes.append(list(code))
+        return codes
+
+    def test_possibilities_remaining(self):
+        """
+        Checks the counter and the listed codes after each guess.
+        """
+        self.assertEqual(self.game.possibilities_remaining(), 360)
+
+        guesses = [
+            ["red", "blue", "green", "yellow"],
+            ["purple", "red", "black", "blue"],
+            ["black", "red", "blue", "purple"]
+        ]
+        for guess in guesses:
+            bulls, cows = self.game.check_guess(guess)
+            self.game.guess_history.append((guess, bulls, cows))
+            self.game.update_candidates(guess, bulls, cows)
+
+            expected = self.consistent_codes()
+            self.assertEqual(self.game.possibilities_remaining(), len(expected))
+            self.assertEqual(self.game.possible_codes(), expected)
+            self.assertIn(self.game.secret_code, expected)
+
+    def test_feedback_masks_partition(self):
+        """
+        Checks that the masks of a guess split the whole code space.
+        """
+        masks = self.code_space.feedback_masks(["red", "blue", "green", "yellow"])
+        union = 0
+        for mask in masks.values():
+            self.assertEqual(union & mask, 0)
+            union |= mask
+        self.assertEqual(union, self.code_space.all_codes)
+        self.assertEqual(masks[(4, 0)].bit_count(), 1)
+
+    def test_partition_remaining_codes(self):
+        """
+        Checks that partitioning a subset of codes gives the same groups as
+        scoring each of its codes one by one.
+        """
+        guess = ("purple", "red", "black", "blue")
+        guess_index = self.code_space.index[guess]
+        # Every third code as the remaining candidates.
+        candidates = sum(1 << i for i in range(0, 360, 3))
+
+        expected = {}
+        for i in range(0, 360, 3):
+            result = self.code_space.feedback(guess_index, i)
+            expected[result] = expected.get(result, 0) | 1 << i
+        self.assertEqual(self.code_space.partition(guess, candidates), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+from types import SimpleNamespace
+from mastermind_driver import ClickDriver, percentile, summarize
+from mastermind_test_support import SessionTestCase, display_available
+
+
+class TestLatencySummary(unittest.TestCase):
+    """
+    This test class possesses unit tests for the latency distribution
+    reported by the click driver.
+    """
+    def test_summarize(self):
+        """
+        Checks the percentiles and the summary of a known distribution.
+        """
+        values = [i / 1000 for i in range(1, 101)]
+        self.assertEqual(percentile(values, 50), 0.05)
+        self.assertEqual(percentile(values, 99), 0.099)
+        self.assertEqual(percentile([], 50), 0)
+
+        summary = summarize(values)
+        self.assertEqual(summary["count"], 100)
+        self.assertAlmostEqual(summary["mean"], 50.5)
+        self.assertAlmostEqual(summary["p90"], 90)
+        self.assertAlmostEqual(summary["max"], 100)
+
+    def test_refresh_count(self):
+        """
+        Checks that the driver counts and times every board refresh, on a
+        stand-in for the game so it runs without a display.
+        """
+        refreshed = []
+        game = SimpleNamespace(update_game_board=lambda: refreshed.append(1))
+        driver = ClickDriver(game)
+        for _ in range(3):
+            game.update_game_board()
+        self.assertEqual(len(refreshed), 3)
+        self.assertEqual(driver.refresh_count, 3)
+        self.assertGreaterEqual(driver.refresh_time, 0)
+
+    def test_reset_rate_checked(self):
+        """
+        Checks that a reset rate which could never finish a game, or is not
+        a chance at all, is rejected.
+        """
+        game = SimpleNamespace(update_game_board=lambda: None)
+        for reset_rate in [1, 1.5, -0.1]:
+            with self.assertRaises(ValueError):
+                ClickDriver(game, reset_rate=reset_rate)
+        ClickDriver(game, reset_rate=0)
+
+
+@unittest.skipUnless(display_available(), "needs a display for the turtle screen")
+class TestClickDriver(SessionTestCase):
+    """
+    This test class drives complete games through on_screen_click and
+    checks that every event is measured.
+    """
+    player_name = "Driver"
+
+    def test_play_games(self):
+        """
+        Checks that the driver plays games to their end and reports the
+        latency and redraw cost of each kind of event.
+        """
+        driver = ClickDriver(self.game, reset_rate=0.2, seed=5)
+        driver.play(3)
+
+        self.assertEqual(self.game.games_played, 3)
+        self.assertEqual(len(driver.game_latencies), 3)
+        report = driver.report()
+        for kind in ["color", "check", "reset", "all"]:
+            self.assertGreater(report[kind]["count"], 0)
+        # Every click on a color or on check redraws the board once.
+        self.assertGreaterEqual(report["check"]["refreshes"], 1)
+        self.assertEqual(report["color"]["refreshes"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,9 @@
+import threading
 import unittest
+from types import SimpleNamespace
 from mastermind_game import MastermindGame
+from mastermind_candidates import get_code_space
+from mastermind_hints import HintWorker
 
 
 class TestMastermindGame(unittest.TestCase):
@@ -47,5 +51,105 @@ class TestMastermindGame(unittest.TestCase):
             self.assertEqual(cows, expected_cows)
 
 
+class TestEvilMode(unittest.TestCase):
+    """
+    This test class possesses unit tests for the adversarial opponent,
+    which picks the feedback keeping the most secret codes possible.
+    """
+    def test_adversary_feedback(self):
+        """
+        Checks that every answer keeps the largest group of codes and stays
+        consistent with the secret code the adversary ends up with.
+        """
+        game = MastermindGame(test_mode=True, evil_mode=True)
+        guesses = [
+            ["red", "blue", "green", "yellow"],
+            ["purple", "black", "red", "blue"],
+            ["green", "red", "black", "purple"]
+        ]
+        for guess in guesses:
+            code_space = get_code_space(game.colors, game.guess_spots)
+            candidates = game.candidates
+            if candidates is None:
+                candidates = code_space.all_codes
+            groups = code_space.partition(guess, candidates)
+
+            bulls, cows = game.adversary_feedback(guess)
+            game.guess_history.append((guess, bulls, cows))
+
+            # No other feedback keeps more codes, and the guess never wins.
+            largest = max(group.bit_count() for group in groups.values())
+            self.assertEqual(game.possibilities_remaining(), largest)
+            self.assertNotEqual(bulls, game.guess_spots)
+
+        # The secret code agrees with every answer given.
+        for guess, bulls, cows in game.guess_history:
+            self.assertEqual(game.check_guess(guess), (bulls, cows))
+        self.assertIn(game.secret_code, game.possible_codes())
+
+
+class TestHistoryScrolling(unittest.TestCase):
+    """
+    This test class possesses unit tests for the scrollable guess history,
+    which shows only the rows that fit in the guessing frame.
+    """
+    def test_scroll_to_row(self):
+        """
+        Checks that a game with more guesses than visible rows scrolls to
+        keep the current row in view, and never past the last row.
+        """
+        game = MastermindGame(test_mode=True)
+        game.num_guesses = 25
+        self.assertEqual(game.visible_row_range(), range(0, 10))
+        self.assertEqual(game.row_y(0), 250)
+
+        game.scroll_to_row(12)
+        self.assertEqual(game.visible_row_range(), range(3, 13))
+        self.assertEqual(game.row_y(12), 250 - 9 * 40)
+
+        game.scroll_to_row(1)
+        self.assertEqual(game.visible_row_range(), range(1, 11))
+
+        game.scroll_to_row(40)
+        self.assertEqual(game.visible_row_range(), range(15, 25))
+
+        # Fewer guesses than rows never scroll.
+        game.num_guesses = 6
+        game.scroll_offset = 0
+        game.scroll_to_row(5)
+        self.assertEqual(game.visible_row_range(), range(0, 6))
+
+
+class TestHintPolling(unittest.TestCase):
+    """
+    This test class possesses unit tests for polling the background hint
+    search, with the timers of the event loop run by hand.
+    """
+    def test_one_poll_per_request(self):
+        """
+        Checks that a hint requested again right after a cancel leaves only
+        the poll of the new request running.
+        """
+        game = MastermindGame(test_mode=True)
+        timers = []
+        game.screen = SimpleNamespace(ontimer=lambda fun, t: timers.append(fun))
+        game.draw_hint = lambda: None
+        game.hint_worker = HintWorker()
+        release = threading.Event()
+        # Holds the background thread so the requests stay pending.
+        game.hint_worker.executor.submit(release.wait)
+        self.addCleanup(game.hint_worker.shutdown)
+        self.addCleanup(release.set)
+
+        game.request_hint()
+        game.cancel_hint()
+        game.request_hint()
+        for _ in range(3):
+            pending, timers[:] = list(timers), []
+            for fun in pending:
+                fun()
+        self.assertEqual(len(timers), 1)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,110 @@
+import threading
+import time
+import unittest
+from mastermind_candidates import CodeSpace
+from mastermind_hints import HintWorker, best_guess
+
+
+class TestMastermindHints(unittest.TestCase):
+    """
+    This test class possesses unit tests for the hint solver and the
+    background hint worker, including cancellation of stale requests.
+    """
+    def setUp(self):
+        """
+        Creates the code space of the standard game before each test.
+        """
+        colors = ["red", "blue", "green", "yellow", "purple", "black"]
+        self.code_space = CodeSpace(colors, 4)
+
+    def wait_for_result(self, worker):
+        """
+        Waits until the worker delivers its result.
+        :param worker: The HintWorker to wait for.
+        :return: The hint delivered by the worker.
+        """
+        for _ in range(500):
+            done, guess = worker.result()
+            if done:
+                return guess
+            time.sleep(0.01)
+        self.fail("Hint was not delivered")
+
+    def test_best_guess(self):
+        """
+        Checks that the solver returns the last possible code, keeps the
+        prefix, and stops when cancelled.
+        """
+        secret = ["black", "red", "purple", "blue"]
+        candidates = 1 << self.code_space.index[tuple(secret)]
+        self.assertEqual(best_guess(self.code_space, candidates), secret)
+
+        all_codes = self.code_space.all_codes
+        hint = best_guess(self.code_space, all_codes, ["green", "blue"])
+        self.assertEqual(hint[:2], ["green", "blue"])
+
+        cancelled = best_guess(self.code_space, all_codes, (), None, lambda: True)
+        self.assertIsNone(cancelled)
+
+    def test_worker_cancels_stale_request(self):
+        """
+        Checks that a cancelled request never delivers a result and that
+        a new request delivers its own hint.
+        """
+        worker = HintWorker()
+        release = threading.Event()
+
+        # Holds the background thread so the first request stays pending.
+        worker.executor.submit(release.wait)
+        worker.submit(self.code_space.colors, 4, [], ["red"])
+        worker.cancel()
+        self.assertFalse(worker.is_active())
+        self.assertEqual(worker.result(), (False, None))
+
+        worker.submit(self.code_space.colors, 4, [], ["yellow"])
+        release.set()
+        hint = self.wait_for_result(worker)
+        self.assertEqual(hint[0], "yellow")
+        self.assertFalse(worker.is_active())
+        worker.shutdown()
+
+    def test_worker_reports_failed_search(self):
+        """
+        Checks that a search raising an error is logged, delivered as no
+        hint, and leaves the worker ready for the next request.
+        """
+        errors = []
+        worker = HintWorker(errors.append)
+        # A color outside the palette makes the search fail.
+        history = [(["pink", "red", "blue", "green"], 0, 0)]
+        worker.submit(self.code_space.colors, 4, history, ["red"])
+        self.assertIsNone(self.wait_for_result(worker))
+        self.assertFalse(worker.is_active())
+        self.assertEqual(len(errors), 1)
+
+        worker.submit(self.code_space.colors, 4, [], ["yellow"])
+        self.assertEqual(self.wait_for_result(worker)[0], "yellow")
+        worker.shutdown()
+
+    def test_shutdown_stops_running_search(self):
+        """
+        Checks that shutting down stops a long search on a large game
+        right away instead of letting it run to the end.
+        """
+        worker = HintWorker()
+        colors = ["c" + str(i) for i in range(8)]
+        worker.submit(colors, 5, [])
+        future = worker.future
+        for _ in range(1000):
+            if worker.progress > 0:
+                break
+            time.sleep(0.01)
+        self.assertGreater(worker.progress, 0)
+
+        worker.shutdown()
+        self.assertIsNone(future.result(timeout=5))
+        self.assertFalse(worker.is_active())
+
+
+if __name__ == '__main__':
+    unittest.main()
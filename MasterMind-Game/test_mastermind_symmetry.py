@@ -0,0 +1,98 @@
+import unittest
+from mastermind_candidates import get_code_space
+from mastermind_hints import SolverCache, best_guess
+from mastermind_symmetry import canonicalize, reduction_report
+
+
+class TestMastermindSymmetry(unittest.TestCase):
+    """
+    This test class possesses unit tests for the symmetry reduction. It
+    checks that equivalent game states share a canonical key, that cached
+    hints are mapped back to the right colors, and that the reduction
+    report counts states correctly.
+    """
+    def setUp(self):
+        """
+        Sets the colors of the standard game and a short guess history.
+        """
+        self.colors = ["red", "blue", "green", "yellow", "purple", "black"]
+        self.history = [
+            (["red", "blue", "green", "yellow"], 1, 1),
+            (["blue", "purple", "red", "black"], 0, 2)
+        ]
+
+    def test_equivalent_states(self):
+        """
+        Checks that renaming colors and reordering pegs keeps the key.
+        """
+        rename = dict(zip(self.colors, reversed(self.colors)))
+        order = [2, 0, 3, 1]
+        renamed = [
+            ([rename[guess[p]] for p in order], bulls, cows)
+            for guess, bulls, cows in self.history
+        ]
+        key = canonicalize(self.colors, 4, self.history)[0]
+        self.assertEqual(canonicalize(self.colors, 4, renamed)[0], key)
+
+        # A different feedback is a different state.
+        changed = self.history[:1] + [(self.history[1][0], 1, 1)]
+        self.assertNotEqual(canonicalize(self.colors, 4, changed)[0], key)
+
+    def test_cached_hint(self):
+        """
+        Checks that a hint solved once is reused for an equivalent state
+        and is as good for that state as a hint solved for it directly.
+        """
+        cache = SolverCache()
+        cache.best_guess(self.colors, 4, self.history)
+
+        rename = dict(zip(self.colors, self.colors[1:] + self.colors[:1]))
+        renamed = [
+            ([rename[color] for color in reversed(guess)], bulls, cows)
+            for guess, bulls, cows in self.history
+        ]
+        hint = cache.best_guess(self.colors, 4, renamed)
+        self.assertEqual((cache.misses, cache.hits), (1, 1))
+
+        code_space = get_code_space(self.colors, 4)
+        candidates = code_space.all_codes
+        for guess, bulls, cows in renamed:
+            candidates = code_space.filter(candidates, guess, bulls, cows)
+
+        def score(guess):
+            # Worst case partition size, then whether it can win.
+            groups = code_space.partition(tuple(guess), candidates)
+            worst = max(group.bit_count() for group in groups.values())
+            index = code_space.index[tuple(guess)]
+            return worst, not (candidates >> index) & 1
+
+        direct = best_guess(code_space, candidates)
+        self.assertEqual(score(hint), score(direct))
+
+    def test_reduction_report(self):
+        """
+        Compares the report with a brute force count of every state of a
+        small game with 4 colors and 3 pegs.
+        """
+        colors = list(range(4))
+        code_space = get_code_space(colors, 3)
+        states = [((), code_space.all_codes)]
+        for guesses, count, canonical, factor in reduction_report(4, 3, 2):
+            children = []
+            for history, candidates in states:
+                for guess in code_space.codes:
+                    groups = code_space.partition(guess, candidates)
+                    for (bulls, cows), group in groups.items():
+                        children.append(
+                            (history + ((guess, bulls, cows),), group)
+                        )
+            states = children
+
+            keys = {canonicalize(colors, 3, h)[0] for h, _ in states}
+            self.assertEqual(count, len(states))
+            self.assertEqual(canonical, len(keys))
+            self.assertEqual(factor, len(states) / len(keys))
+
+
+if __name__ == '__main__':
+    unittest.main()
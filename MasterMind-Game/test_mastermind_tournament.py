@@ -0,0 +1,105 @@
+import itertools
+import random
+import unittest
+from mastermind_tournament import (
+    Tournament, count_codes, derive_seed, generate_secrets,
+    secret_code_for_game, unrank_code
+)
+
+
+class TestMastermindTournament(unittest.TestCase):
+    """
+    This test class possesses unit tests for the tournament mode. It checks
+    that secret codes are reproducible from the tournament seed and game
+    index, and that players are ranked by their total score.
+    """
+    def setUp(self):
+        """
+        Creates a small tournament with a fixed seed before each test.
+        """
+        self.tournament = Tournament(["Ada", "Bob", "Cy"], 5, seed=2024)
+
+    def test_unrank_matches_permutations(self):
+        """
+        Checks that unrank_code follows the order of itertools.permutations.
+        """
+        colors = self.tournament.colors
+        for rank, code in enumerate(itertools.permutations(colors, 4)):
+            self.assertEqual(unrank_code(rank, colors, 4), list(code))
+
+    def test_secrets_reproducible(self):
+        """
+        Checks that every game can be regenerated from the seed and its
+        game index, alone or in a worker's block.
+        """
+        colors = self.tournament.colors
+        for player in range(3):
+            for round_number in range(5):
+                index = self.tournament.game_index(player, round_number)
+                self.assertEqual(
+                    self.tournament.secrets[player][round_number],
+                    secret_code_for_game(2024, index, colors, 4)
+                )
+
+        # Worker blocks put together give the same secrets.
+        blocks = []
+        for worker in range(4):
+            start, count = self.tournament.worker_games(worker, 4)
+            blocks += generate_secrets(2024, count, colors, 4, start)
+        self.assertEqual(blocks, generate_secrets(2024, 15, colors, 4))
+
+        # Each game's secret is its own derived stream, unranked.
+        for index in [0, 7, 14]:
+            rank = derive_seed(2024, index) % count_codes(len(colors), 4)
+            self.assertEqual(unrank_code(rank, colors, 4),
+                             secret_code_for_game(2024, index, colors, 4))
+
+        # A different seed gives different secrets.
+        self.assertNotEqual(blocks, generate_secrets(2025, 15, colors, 4))
+
+    def test_global_random_untouched(self):
+        """
+        Checks that creating and playing a tournament leaves the global
+        random generator alone, so seeded callers stay reproducible.
+        """
+        random.seed(7)
+        state = random.getstate()
+        tournament = Tournament(["Ada"], 2, seed=3)
+        tournament.play({"Ada": lambda game: game.secret_code})
+        self.assertEqual(random.getstate(), state)
+
+    def test_rankings(self):
+        """
+        Checks that players are ranked by total score in ascending order.
+        """
+        def cheater(game):
+            # Always guesses the secret code.
+            return game.secret_code
+
+        def first_color(game):
+            # Guesses the first colors until it runs out of guesses.
+            return game.colors[:game.guess_spots]
+
+        self.tournament.play({
+            "Ada": first_color, "Bob": cheater, "Cy": cheater
+        })
+        rankings = self.tournament.rankings()
+        self.assertEqual(rankings[0], ("Bob", 5))
+        self.assertEqual(rankings[1], ("Cy", 5))
+        self.assertEqual(rankings[2][0], "Ada")
+
+    def test_rankings_partly_played(self):
+        """
+        Checks that rounds not played yet count as the worst score.
+        """
+        tournament = Tournament(["Ada", "Bob"], 2, seed=1)
+        for round_number in range(2):
+            tournament.play_game(0, round_number, lambda game: game.secret_code)
+        self.assertEqual(tournament.rankings(), [("Ada", 2), ("Bob", 20)])
+
+        tournament.play_game(1, 0, lambda game: game.secret_code)
+        self.assertEqual(tournament.rankings(), [("Ada", 2), ("Bob", 11)])
+
+
+if __name__ == '__main__':
+    unittest.main()